@@ -41,6 +41,12 @@ from ._displaybus import _DisplayBus
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_Blinka_displayio.git"
 
+# Waits shorter than this are busy-waited rather than handed to time.sleep()
+_SPIN_WAIT_NS = 2_000_000
+
+# Tallest subrectangle rendered and sent in one piece
+_SUBRECTANGLE_ROWS = 64
+
 
 class BusDisplay:
     # pylint: disable=too-many-instance-attributes, too-many-statements
@@ -151,17 +157,31 @@ class BusDisplay:
             address_little_endian=False,
         )
 
-        self._write_ram_command = write_ram_command
+        # Pixel count to byte count is size * multiplier // divisor for any color depth
+        self._bytes_per_pixel_multiplier = max(color_depth // 8, 1)
+        self._pixels_per_byte_divisor = max(8 // color_depth, 1)
+
+        # Sent ahead of every subrectangle, so pack it once
+        self._write_ram_command = bytes((write_ram_command,))
         self._brightness_command = brightness_command
+        # Command byte followed by the level byte, updated in place on each change
+        self._brightness_payload = memoryview(bytearray((brightness_command or 0, 0)))
         self._first_manual_refresh = not auto_refresh
         self._backlight_on_high = backlight_on_high
+        # Map brightness onto the PWM duty cycle without branching on polarity
+        self._pwm_scale = 0xFFFF if backlight_on_high else -0xFFFF
+        self._pwm_bias = 0 if backlight_on_high else 0xFFFF
 
         self._native_frames_per_second = native_frames_per_second
         self._native_ms_per_frame = 1000 // native_frames_per_second
 
         self._brightness = brightness
-        self._auto_refresh = auto_refresh
 
+        # Slice parameters out of a view so they aren't copied for every command
+        init_sequence = memoryview(init_sequence)
+        # Commands with inline data are assembled in one reused buffer; the
+        # parameter count is seven bits so it always fits
+        command_buffer = memoryview(bytearray(1 + (~DELAY & 0xFF)))
         i = 0
         while i < len(init_sequence):
             command = init_sequence[i]
@@ -172,17 +192,20 @@ class BusDisplay:
                 pass
 
             if self._core.data_as_commands:
-                full_command = bytearray(data_size + 1)
-                full_command[0] = command
-                full_command[1:] = init_sequence[i + 2 : i + 2 + data_size]
+                command_buffer[0] = command
+                command_buffer[1 : data_size + 1] = init_sequence[
+                    i + 2 : i + 2 + data_size
+                ]
                 self._core.send(
                     DISPLAY_COMMAND,
                     CHIP_SELECT_TOGGLE_EVERY_BYTE,
-                    full_command,
+                    command_buffer[: data_size + 1],
                 )
             else:
                 self._core.send(
-                    DISPLAY_COMMAND, CHIP_SELECT_TOGGLE_EVERY_BYTE, bytes([command])
+                    DISPLAY_COMMAND,
+                    CHIP_SELECT_TOGGLE_EVERY_BYTE,
+                    init_sequence[i : i + 1],
                 )
                 self._core.send(
                     DISPLAY_DATA,
@@ -202,6 +225,11 @@ class BusDisplay:
         self._current_group = None
         self._last_refresh_call = 0
         self._refresh_thread = None
+        self._refresh_areas = []
+        self._visible_area = Area()
+        # Pooled subrectangle area, pixel buffer and mask, reused across refreshes
+        self._buffer_set = [Area(), bytearray(0), bytearray(0)]
+        self._zeros = memoryview(b"")
         self._colorconverter = ColorConverter()
 
         self._backlight_type = None
@@ -238,7 +266,7 @@ class BusDisplay:
             self._core.send(
                 DISPLAY_COMMAND,
                 CHIP_SELECT_TOGGLE_EVERY_BYTE,
-                bytes([self._write_ram_command]),
+                self._write_ram_command,
             )
         self._core.send(DISPLAY_DATA, CHIP_SELECT_UNTOUCHED, pixels)
 
@@ -282,7 +310,7 @@ class BusDisplay:
             and not self._first_manual_refresh
             and target_ms_per_frame != 0xFFFFFFFF
         ):
-            current_time = time.monotonic() * 1000
+            current_time = time.monotonic_ns() // 1_000_000
             current_ms_since_real_refresh = current_time - self._core.last_refresh
             if current_ms_since_real_refresh > maximum_ms_per_real_frame:
                 raise RuntimeError("Below minimum frame rate")
@@ -294,7 +322,15 @@ class BusDisplay:
             remaining_time = target_ms_per_frame - (
                 current_ms_since_real_refresh % target_ms_per_frame
             )
-            time.sleep(remaining_time / 1000)
+            # Sleep through most of the wait, but spin for the last couple of
+            # milliseconds so scheduler granularity doesn't overshoot the frame
+            deadline = time.monotonic_ns() + int(remaining_time * 1_000_000)
+            while True:
+                remaining_ns = deadline - time.monotonic_ns()
+                if remaining_ns <= 0:
+                    break
+                if remaining_ns > _SPIN_WAIT_NS:
+                    time.sleep((remaining_ns - _SPIN_WAIT_NS) / 1_000_000_000)
         self._first_manual_refresh = False
         self._refresh_display()
         return True
@@ -304,6 +340,11 @@ class BusDisplay:
             return False
 
         areas_to_refresh = self._get_refresh_areas()
+        if not areas_to_refresh:
+            # Nothing is dirty, so only the layers' refresh state needs settling
+            self._core.finish_refresh()
+            return True
+
         for area in areas_to_refresh:
             self._refresh_area(area)
 
@@ -312,29 +353,53 @@ class BusDisplay:
         return True
 
     def _get_refresh_areas(self) -> list[Area]:
-        """Get a list of areas to be refreshed"""
-        areas = []
+        """Get a list of areas to be refreshed. The list is reused between refreshes."""
+        areas = self._refresh_areas
+        areas.clear()
         if self._core.full_refresh:
             areas.append(self._core.area)
         elif self._core.current_group is not None:
             self._core.current_group._get_refresh_areas(  # pylint: disable=protected-access
                 areas
             )
+            # Once the visible dirty areas add up to the whole display, one full pass
+            # draws fewer pixels than redrawing each area and their overlaps
+            if len(areas) > 1:
+                display_area = self._core.area
+                visible = self._visible_area
+                dirty_size = 0
+                for area in areas:
+                    if area.compute_overlap(display_area, visible):
+                        dirty_size += visible.size()
+                if dirty_size >= display_area.size():
+                    areas.clear()
+                    areas.append(display_area)
         return areas
 
-    def _background(self):
-        """Run background refresh tasks. Do not call directly"""
-        if (
-            self._auto_refresh
-            and (time.monotonic() * 1000 - self._core.last_refresh)
-            > self._native_ms_per_frame
-        ):
+    def _background(self) -> Optional[float]:
+        """Run background refresh tasks and return the seconds until they are next
+        due, or None when auto refresh is off. Do not call directly"""
+        # Displays are registered before they finish initializing
+        if not getattr(self, "_auto_refresh", False):
+            return None
+        remaining_ms = (
+            self._core.last_refresh
+            + self._native_ms_per_frame
+            - time.monotonic_ns() // 1_000_000
+        )
+        if remaining_ms <= 0:
             self.refresh()
+            remaining_ms = self._native_ms_per_frame
+        return remaining_ms / 1000
 
     def _refresh_area(self, area) -> bool:
         """Loop through dirty areas and redraw that area."""
         # pylint: disable=too-many-locals, too-many-branches
 
+        # Degenerate areas never overlap the display, so skip them before any setup
+        if area.x2 <= area.x1 or area.y2 <= area.y1:
+            return True
+
         clipped = Area()
         # Clip the area to the display by overlapping the areas.
         # If there is no overlap then we're done.
@@ -345,8 +410,12 @@ class BusDisplay:
         pixels_per_word = 32 // self._core.colorspace.depth
         pixels_per_buffer = clipped.size()
 
-        # We should have lots of memory
-        buffer_size = clipped.size() // pixels_per_word
+        # Render in blocks of rows so each block stays in cache
+        buffer_size = (
+            min(clipped.height(), _SUBRECTANGLE_ROWS)
+            * clipped.width()
+            // pixels_per_word
+        )
 
         subrectangles = 1
         # for SH1107 and other boundary constrained controllers
@@ -354,6 +423,10 @@ class BusDisplay:
         if self._core.sh1107_addressing:
             subrectangles = rows_per_buffer // 8
             rows_per_buffer = 8
+            pixels_per_buffer = rows_per_buffer * clipped.width()
+            buffer_size = pixels_per_buffer // pixels_per_word
+            if pixels_per_buffer % pixels_per_word:
+                buffer_size += 1
         elif clipped.size() > buffer_size * pixels_per_word:
             rows_per_buffer = buffer_size * pixels_per_word // clipped.width()
             if rows_per_buffer == 0:
@@ -377,38 +450,49 @@ class BusDisplay:
         remaining_rows = clipped.height()
 
         for subrect_index in range(subrectangles):
-            subrectangle = Area(
-                x1=clipped.x1,
-                y1=clipped.y1 + rows_per_buffer * subrect_index,
-                x2=clipped.x2,
-                y2=clipped.y1 + rows_per_buffer * (subrect_index + 1),
-            )
+            subrectangle, buffer, mask = self._get_buffers(buffer_size, mask_length)
+            subrectangle.x1 = clipped.x1
+            subrectangle.x2 = clipped.x2
+            subrectangle.y1 = clipped.y1 + rows_per_buffer * subrect_index
+            subrectangle.y2 = subrectangle.y1 + rows_per_buffer
             if remaining_rows < rows_per_buffer:
                 subrectangle.y2 = subrectangle.y1 + remaining_rows
             remaining_rows -= rows_per_buffer
-            self._core.set_region_to_update(subrectangle)
-            if self._core.colorspace.depth >= 8:
-                subrectangle_size_bytes = subrectangle.size() * (
-                    self._core.colorspace.depth // 8
-                )
-            else:
-                subrectangle_size_bytes = subrectangle.size() // (
-                    8 // self._core.colorspace.depth
-                )
+            subrectangle_size_bytes = (
+                subrectangle.size()
+                * self._bytes_per_pixel_multiplier
+                // self._pixels_per_byte_divisor
+            )
 
-            buffer = memoryview(bytearray([0] * (buffer_size * 4))).cast("I")
-            mask = memoryview(bytearray([0] * (mask_length * 4))).cast("I")
             self._core.fill_area(subrectangle, mask, buffer)
 
             # Can't acquire display bus; skip the rest of the data.
             if not self._core.bus_free():
                 return False
 
+            # Select the region and stream its pixels under a single transaction
             self._core.begin_transaction()
-            self._send_pixels(buffer.tobytes()[:subrectangle_size_bytes])
+            self._core.send_region_commands(subrectangle)
+            self._send_pixels(buffer.cast("B")[:subrectangle_size_bytes])
             self._core.end_transaction()
         return True
 
+    def _get_buffers(self, buffer_size: int, mask_length: int) -> tuple:
+        """Get the pooled area, pixel buffer and mask (cleared, as word views)"""
+        buffer_set = self._buffer_set
+        for i, size in ((1, buffer_size * 4), (2, mask_length * 4)):
+            if len(buffer_set[i]) < size:
+                buffer_set[i] = bytearray(size)
+            else:
+                if len(self._zeros) < size:
+                    self._zeros = memoryview(bytes(size))
+                buffer_set[i][:size] = self._zeros[:size]
+        return (
+            buffer_set[0],
+            memoryview(buffer_set[1])[: buffer_size * 4].cast("I"),
+            memoryview(buffer_set[2])[: mask_length * 4].cast("I"),
+        )
+
     def fill_row(self, y: int, buffer: WriteableBuffer) -> WriteableBuffer:
         """Extract the pixels from a single row"""
         if self._core.colorspace.depth != 16:
@@ -421,9 +505,9 @@ class BusDisplay:
         if pixels_per_buffer % pixels_per_word:
             buffer_size += 1
 
-        buffer = memoryview(bytearray([0] * (buffer_size * 4))).cast("I")
+        buffer = memoryview(bytearray(buffer_size * 4)).cast("I")
         mask_length = (pixels_per_buffer // 32) + 1
-        mask = memoryview(bytearray([0] * (mask_length * 4))).cast("I")
+        mask = memoryview(bytearray(mask_length * 4)).cast("I")
         self._core.fill_area(area, mask, buffer)
         return buffer
 
@@ -457,36 +541,39 @@ class BusDisplay:
 
     @brightness.setter
     def brightness(self, value: float):
-        if 0 <= float(value) <= 1.0:
-            if not self._backlight_on_high:
-                value = 1.0 - value
-
-            if self._backlight_type == BACKLIGHT_PWM:
-                self._backlight.duty_cycle = value * 0xFFFF
-            elif self._backlight_type == BACKLIGHT_IN_OUT:
-                self._backlight.value = value > 0.99
+        value = float(value)
+        if not 0.0 <= value <= 1.0:
+            raise ValueError("Brightness must be between 0.0 and 1.0")
+
+        if self._backlight_type == BACKLIGHT_PWM:
+            self._backlight.duty_cycle = int(self._pwm_bias + value * self._pwm_scale)
+        else:
+            level = value if self._backlight_on_high else 1.0 - value
+            if self._backlight_type == BACKLIGHT_IN_OUT:
+                self._backlight.value = level > 0.99
             elif self._brightness_command is not None:
                 okay = self._core.begin_transaction()
                 if okay:
+                    self._brightness_payload[1] = round(0xFF * level)
                     if self._core.data_as_commands:
                         self._core.send(
                             DISPLAY_COMMAND,
                             CHIP_SELECT_TOGGLE_EVERY_BYTE,
-                            bytes([self._brightness_command, round(0xFF * value)]),
+                            self._brightness_payload,
                         )
                     else:
                         self._core.send(
                             DISPLAY_COMMAND,
                             CHIP_SELECT_TOGGLE_EVERY_BYTE,
-                            bytes([self._brightness_command]),
+                            self._brightness_payload[:1],
                         )
                         self._core.send(
-                            DISPLAY_DATA, CHIP_SELECT_UNTOUCHED, round(value * 255)
+                            DISPLAY_DATA,
+                            CHIP_SELECT_UNTOUCHED,
+                            self._brightness_payload[1:],
                         )
                     self._core.end_transaction()
-            self._brightness = value
-        else:
-            raise ValueError("Brightness must be between 0.0 and 1.0")
+        self._brightness = value
 
     @property
     def width(self) -> int:
@@ -507,12 +594,8 @@ class BusDisplay:
     def rotation(self, value: int):
         if value % 90 != 0:
             raise ValueError("Display rotation must be in 90 degree increments")
-        transposed = self._core.rotation in (90, 270)
-        will_transposed = value in (90, 270)
-        if transposed != will_transposed:
-            self._core.width, self._core.height = self._core.height, self._core.width
-        self._core.set_rotation(value)
-        if self._core.current_group is not None:
+        # The scene's transforms only need rebuilding when the rotation changes
+        if self._core.set_rotation(value) and self._core.current_group is not None:
             self._core.current_group._update_transform(  # pylint: disable=protected-access
                 self._core.transform
             )
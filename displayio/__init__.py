@@ -17,6 +17,7 @@ displayio for Blinka
 
 """
 import threading
+import time
 from typing import Union
 
 import fourwire
@@ -47,11 +48,22 @@ displays = []
 display_buses = []
 
 
+# Longest the background thread sleeps, so displays without a frame deadline
+# (such as ePaper busy polling) are still serviced promptly
+_BACKGROUND_IDLE_SECONDS = 0.01
+
+
 def _background():
     """Main thread function to loop through all displays and update them"""
     while True:
+        delay = _BACKGROUND_IDLE_SECONDS
         for display in displays:
-            display._background()  # pylint: disable=protected-access
+            next_due = display._background()  # pylint: disable=protected-access
+            if next_due is not None:
+                delay = min(delay, next_due)
+        # Sleep until the next frame is due rather than spinning a core
+        if delay > 0:
+            time.sleep(delay)
 
 
 def release_displays() -> None:
@@ -27,13 +27,15 @@ __repo__ = "https://github.com/adafruit/Adafruit_Blinka_Displayio.git"
 class Area:
     """Area Class to represent an area to be updated."""
 
+    # Many areas are made and clipped per refresh, so keep them dict free
+    __slots__ = ("x1", "y1", "x2", "y2")
+
     # pylint: disable=invalid-name
     def __init__(self, x1: int = 0, y1: int = 0, x2: int = 0, y2: int = 0):
         self.x1 = x1
         self.y1 = y1
         self.x2 = x2
         self.y2 = y2
-        self.next = None
 
     def __str__(self):
         return f"Area TL({self.x1},{self.y1}) BR({self.x2},{self.y2})"
@@ -87,10 +89,10 @@ class Area:
     def union(self, other, union):
         """Combine this area along with another into union"""
         if self.empty():
-            self.copy_into(union)
+            other.copy_into(union)
             return
         if other.empty():
-            other.copy_into(union)
+            self.copy_into(union)
             return
 
         union.x1 = min(self.x1, other.x1)
@@ -18,7 +18,7 @@ displayio for Blinka
 """
 
 from __future__ import annotations
-import struct
+import sys
 from array import array
 from typing import Union, Tuple
 from circuitpython_typing import WriteableBuffer
@@ -35,6 +35,7 @@ def stride(width: int, bits_per_pixel: int) -> int:
 
 
 class Bitmap:
+    # pylint: disable=too-many-instance-attributes
     """Stores values of a certain size in a 2D array
 
     Bitmaps can be treated as read-only buffers. If the number of bits in a pixel is 8, 16,
@@ -83,10 +84,18 @@ class Bitmap:
         self._stride = stride(width, bits_per_value)
         self._data_alloc = False
 
+        data_size = self._stride * height * 4
         if data is None or len(data) == 0:
-            data = array("L", [0] * self._stride * height)
+            data = array("I", [0] * self._stride * height)
             self._data_alloc = True
+        else:
+            # Supplied buffers are addressed in 32-bit words like the allocated array
+            data = memoryview(data).cast("B")
+            if len(data) < data_size:
+                raise ValueError("Buffer is too small for the bitmap")
+            data = data[:data_size].cast("I")
         self._data = data
+        self._bytes = memoryview(data).cast("B")
         self._read_only = read_only
         self._bits_per_value = bits_per_value
 
@@ -113,6 +122,14 @@ class Bitmap:
 
         self._x_mask = (1 << self._x_shift) - 1  # Used as a modulus on the x value
         self._bitmask = (1 << bits_per_value) - 1
+
+        # Values of 8 bits or more are read and written through a typed view of the
+        # data rather than by packing and unpacking them one at a time.
+        self._values = None
+        self._values_per_row = 0
+        if bits_per_value >= 8:
+            self._values = self._bytes.cast({8: "B", 16: "H", 32: "I"}[bits_per_value])
+            self._values_per_row = self._stride * 32 // bits_per_value
         self._dirty_area = Area(0, 0, width, height)
 
     def __getitem__(self, index: Union[Tuple[int, int], int]) -> int:
@@ -135,21 +152,12 @@ class Bitmap:
     def _get_pixel(self, x: int, y: int) -> int:
         if x >= self._bmp_width or x < 0 or y >= self._bmp_height or y < 0:
             return 0
-        row_start = y * self._stride
-        bytes_per_value = self._bits_per_value // 8
-        if bytes_per_value < 1:
-            word = self._data[row_start + (x >> self._x_shift)]
-            return (
-                word >> (32 - ((x & self._x_mask) + 1) * self._bits_per_value)
-            ) & self._bitmask
-        row = memoryview(self._data)[row_start : row_start + self._stride]
-        if bytes_per_value == 1:
-            return row[x]
-        if bytes_per_value == 2:
-            return struct.unpack_from("<H", row, x * 2)[0]
-        if bytes_per_value == 4:
-            return struct.unpack_from("<I", row, x * 4)[0]
-        return 0
+        if self._values is not None:
+            return self._values[y * self._values_per_row + x]
+        word = self._data[y * self._stride + (x >> self._x_shift)]
+        return (
+            word >> (32 - ((x & self._x_mask) + 1) * self._bits_per_value)
+        ) & self._bitmask
 
     def __setitem__(self, index: Union[Tuple[int, int], int], value: int) -> None:
         """
@@ -181,23 +189,15 @@ class Bitmap:
             return
 
         # Update one pixel of data
-        row_start = y * self._stride
-        bytes_per_value = self._bits_per_value // 8
-        if bytes_per_value < 1:
-            bit_position = 32 - ((x & self._x_mask) + 1) * self._bits_per_value
-            index = row_start + (x >> self._x_shift)
-            word = self._data[index]
-            word &= ~(self._bitmask << bit_position)
-            word |= (value & self._bitmask) << bit_position
-            self._data[index] = word
-        else:
-            row = memoryview(self._data)[row_start : row_start + self._stride]
-            if bytes_per_value == 1:
-                row[x] = value
-            elif bytes_per_value == 2:
-                struct.pack_into("<H", row, x * 2, value)
-            elif bytes_per_value == 4:
-                struct.pack_into("<I", row, x * 4, value)
+        if self._values is not None:
+            self._values[y * self._values_per_row + x] = value & self._bitmask
+            return
+        bit_position = 32 - ((x & self._x_mask) + 1) * self._bits_per_value
+        index = y * self._stride + (x >> self._x_shift)
+        word = self._data[index]
+        word &= ~(self._bitmask << bit_position)
+        word |= (value & self._bitmask) << bit_position
+        self._data[index] = word
 
     def _finish_refresh(self):
         self._dirty_area.x1 = 0
@@ -215,8 +215,9 @@ class Bitmap:
             word |= (value & self._bitmask) << (32 - ((i + 1) * self._bits_per_value))
 
         # copy it in
-        for i in range(self._stride * self._bmp_height):
-            self._data[i] = word
+        self._bytes[:] = word.to_bytes(4, sys.byteorder) * (
+            self._stride * self._bmp_height
+        )
 
     def blit(
         self,
@@ -20,10 +20,14 @@ displayio for Blinka
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_Blinka_displayio.git"
 
+from dataclasses import replace
 from ._colorspace import Colorspace
 from ._structs import ColorspaceStruct, InputPixelStruct, OutputPixelStruct
 from ._helpers import clamp, bswap16
 
+# Converted colors remembered per colorspace before the cache starts over
+_CACHE_SIZE = 256
+
 
 class ColorConverter:
     """Converts one color format to another. Color converter based on original displayio
@@ -43,8 +47,7 @@ class ColorConverter:
         self._input_colorspace = input_colorspace
         self._output_colorspace = ColorspaceStruct(16)
         self._cached_colorspace = None
-        self._cached_input_pixel = None
-        self._cached_output_color = None
+        self._cached_colors = {}
         self._needs_refresh = False
 
     @staticmethod
@@ -66,6 +69,14 @@ class ColorConverter:
         blu5 = (color_rgb888 >> 3) & 0x1F
         return red5 << 11 | grn6 << 5 | blu5
 
+    @staticmethod
+    def _compute_rgb565_swapped(color_rgb888: int):
+        # Pack straight into the byte swapped layout instead of packing then swapping
+        red5 = color_rgb888 >> 19
+        grn6 = (color_rgb888 >> 10) & 0x3F
+        blu5 = (color_rgb888 >> 3) & 0x1F
+        return (grn6 & 0x7) << 13 | blu5 << 8 | red5 << 3 | grn6 >> 3
+
     @staticmethod
     def _compute_rgb332(color_rgb888: int):
         red3 = color_rgb888 >> 21
@@ -186,13 +197,16 @@ class ColorConverter:
             output_color.opaque = False
             return
 
-        if (
-            not self._dither
-            and self._cached_colorspace == colorspace
-            and self._cached_input_pixel == input_pixel.pixel
-        ):
-            output_color.pixel = self._cached_output_color
-            return
+        if not self._dither:
+            # Displays change fields such as grayscale_bit on the same colorspace
+            # between passes, so compare a snapshot of it rather than its identity
+            if self._cached_colorspace != colorspace:
+                self._cached_colorspace = replace(colorspace)
+                self._cached_colors.clear()
+            cached_color = self._cached_colors.get(pixel)
+            if cached_color is not None:
+                output_color.pixel = cached_color
+                return
 
         rgb888_pixel = input_pixel
         rgb888_pixel.pixel = self._convert_pixel(
@@ -200,10 +214,10 @@ class ColorConverter:
         )
         self._convert_color(colorspace, self._dither, rgb888_pixel, output_color)
 
-        if not self._dither:
-            self._cached_colorspace = colorspace
-            self._cached_input_pixel = input_pixel.pixel
-            self._cached_output_color = output_color.pixel
+        if not self._dither and output_color.opaque:
+            if len(self._cached_colors) >= _CACHE_SIZE:
+                self._cached_colors.clear()
+            self._cached_colors[pixel] = output_color.pixel
 
     @staticmethod
     def _convert_pixel(colorspace: Colorspace, pixel: int) -> int:
@@ -275,10 +289,10 @@ class ColorConverter:
             pixel = (red8 << 16) | (grn8 << 8) | blu8
 
         if colorspace.depth == 16:
-            packed = ColorConverter._compute_rgb565(pixel)
             if colorspace.reverse_bytes_in_word:
-                packed = bswap16(packed)
-            output_color.pixel = packed
+                output_color.pixel = ColorConverter._compute_rgb565_swapped(pixel)
+            else:
+                output_color.pixel = ColorConverter._compute_rgb565(pixel)
             output_color.opaque = True
             return
         if colorspace.tricolor:
@@ -24,15 +24,12 @@ __repo__ = "https://github.com/adafruit/Adafruit_Blinka_Displayio.git"
 
 import time
 import struct
-from circuitpython_typing import WriteableBuffer, ReadableBuffer
-from paralleldisplaybus import ParallelBus
-from fourwire import FourWire
-from i2cdisplaybus import I2CDisplayBus
+from typing import Optional
+from circuitpython_typing import WriteableBuffer
 from busdisplay._displaybus import _DisplayBus
 from ._group import Group
 from ._structs import ColorspaceStruct, TransformStruct
 from ._area import Area
-from ._helpers import bswap16
 from ._constants import (
     CHIP_SELECT_UNTOUCHED,
     CHIP_SELECT_TOGGLE_EVERY_BYTE,
@@ -41,10 +38,75 @@ from ._constants import (
     NO_COMMAND,
 )
 
+# (transpose_xy, mirror_x, mirror_y) for each rotation
+_ROTATIONS = {
+    0: (False, False, False),
+    90: (True, True, False),
+    180: (False, True, True),
+    270: (True, False, True),
+}
+
+# Methods the display core binds from its bus
+_BUS_METHODS = ("reset", "_free", "_begin_transaction", "_send", "_end_transaction")
+
+
+def _pack_command(command: int) -> Optional[bytes]:
+    """Pack a command into the byte sent for it, or None for NO_COMMAND"""
+    if command == NO_COMMAND:
+        return None
+    return bytes((command,))
+
 
 class _DisplayCore:
     # pylint: disable=too-many-arguments, too-many-instance-attributes, too-many-locals, too-many-branches, too-many-statements
 
+    # Every refresh reads these, so keep them in fixed slots rather than a dict
+    __slots__ = (
+        "colorspace",
+        "_column_divisor",
+        "_row_divisor",
+        "current_group",
+        "colstart",
+        "rowstart",
+        "last_refresh",
+        "column_command",
+        "row_command",
+        "set_current_column_command",
+        "set_current_row_command",
+        "_column_command",
+        "_row_command",
+        "_set_current_column_command",
+        "_set_current_row_command",
+        "data_as_commands",
+        "always_toggle_chip_select",
+        "sh1107_addressing",
+        "address_little_endian",
+        "_region_chip_select",
+        "_send_region",
+        "refresh_in_progress",
+        "full_refresh",
+        "_reset",
+        "_bus_free",
+        "_begin_transaction",
+        "_send",
+        "_end_transaction",
+        "send",
+        "begin_transaction",
+        "end_transaction",
+        "_bus",
+        "area",
+        "width",
+        "height",
+        "ram_width",
+        "ram_height",
+        "_column_bounds",
+        "_row_bounds",
+        "_last_column_bounds",
+        "_last_row_bounds",
+        "rotation",
+        "transform",
+    )
+
     def __init__(
         self,
         bus,
@@ -80,6 +142,16 @@ class _DisplayCore:
             reverse_bytes_in_word=reverse_bytes_in_word,
             dither=False,
         )
+        # Packed pixels are addressed a cell at a time along the packed axis, so
+        # region bounds on that axis are divided by the pixels in a cell
+        self._column_divisor = 1
+        self._row_divisor = 1
+        if color_depth < 8:
+            pixels_per_cell = 8 // color_depth * bytes_per_cell
+            if pixels_in_byte_share_row:
+                self._column_divisor = pixels_per_cell
+            else:
+                self._row_divisor = pixels_per_cell
         self.current_group = None
         self.colstart = colstart
         self.rowstart = rowstart
@@ -89,22 +161,42 @@ class _DisplayCore:
         self.row_command = row_command
         self.set_current_column_command = set_current_column_command
         self.set_current_row_command = set_current_row_command
+        # Region commands are sent for every update, so pack them once
+        self._column_command = _pack_command(column_command)
+        self._row_command = _pack_command(row_command)
+        self._set_current_column_command = _pack_command(set_current_column_command)
+        self._set_current_row_command = _pack_command(set_current_row_command)
         self.data_as_commands = data_as_commands
         self.always_toggle_chip_select = always_toggle_chip_select
         self.sh1107_addressing = sh1107_addressing
         self.address_little_endian = address_little_endian
+        self._region_chip_select = CHIP_SELECT_UNTOUCHED
+        if always_toggle_chip_select or data_as_commands:
+            self._region_chip_select = CHIP_SELECT_TOGGLE_EVERY_BYTE
+        # The addressing mode is fixed, so pick the region sender for it once
+        if sh1107_addressing:
+            self._send_region = self._send_region_sh1107
+        elif data_as_commands:
+            self._send_region = self._send_region_as_commands
+        else:
+            self._send_region = self._send_region_as_data
 
         self.refresh_in_progress = False
         self.full_refresh = False
         self.last_refresh = 0
 
         if bus:
-            if isinstance(bus, (FourWire, I2CDisplayBus, ParallelBus)):
-                self._bus_reset = bus.reset
+            # Any bus providing the display bus methods will do
+            if all(hasattr(bus, method) for method in _BUS_METHODS):
+                self._reset = bus.reset
                 self._bus_free = bus._free
                 self._begin_transaction = bus._begin_transaction
                 self._send = bus._send
                 self._end_transaction = bus._end_transaction
+                # Callers use the bus methods directly rather than through wrappers
+                self.send = self._send
+                self.begin_transaction = self._begin_transaction
+                self.end_transaction = self._end_transaction
             else:
                 raise ValueError("Unsupported display bus type")
 
@@ -115,63 +207,59 @@ class _DisplayCore:
         self.height = height
         self.ram_width = ram_width
         self.ram_height = ram_height
-        self.rotation = rotation
+        # Region bounds are a byte each for small RAM, otherwise 16 bits in the
+        # controller's byte order. Compile the formats once.
+        bounds_format = "<HH" if address_little_endian else ">HH"
+        self._column_bounds = struct.Struct(
+            ">BB" if ram_width < 0x100 else bounds_format
+        )
+        self._row_bounds = struct.Struct(">BB" if ram_height < 0x100 else bounds_format)
+        # The controller keeps its window between writes and RAMWR rewinds to its
+        # start, so the last bounds sent are remembered to skip resending them.
+        # Displays that address as commands or by page always resend.
+        self._last_column_bounds = None
+        self._last_row_bounds = None
+        self.rotation = rotation % 360
         self.transform = TransformStruct()
 
-        self.set_rotation(rotation)
+        self._update_rotation()
 
-    def set_rotation(self, rotation: int) -> None:
+    def set_rotation(self, rotation: int) -> bool:
         """
-        Sets the rotation of the display as an int in degrees.
+        Sets the rotation of the display as an int in degrees. Returns whether the
+        rotation changed.
         """
-        # pylint: disable=protected-access, too-many-branches
-        height = self.height
-        width = self.width
-
         rotation %= 360
+        if rotation == self.rotation:
+            return False
+        if (self.rotation in (90, 270)) != (rotation in (90, 270)):
+            self.width, self.height = self.height, self.width
         self.rotation = rotation
-        self.transform.x = 0
-        self.transform.y = 0
-        self.transform.scale = 1
-        self.transform.mirror_x = False
-        self.transform.mirror_y = False
-        self.transform.transpose_xy = False
-
-        if rotation in (0, 180):
-            if rotation == 180:
-                self.transform.mirror_x = True
-                self.transform.mirror_y = True
-        else:
-            self.transform.transpose_xy = True
-            if rotation == 270:
-                self.transform.mirror_y = True
-            else:
-                self.transform.mirror_x = True
+        self._update_rotation()
+        return True
+
+    def _update_rotation(self) -> None:
+        transpose_xy, mirror_x, mirror_y = _ROTATIONS[self.rotation]
+
+        width = self.width
+        height = self.height
+        if transpose_xy:
+            width, height = height, width
 
         self.area.x1 = 0
         self.area.y1 = 0
-        self.area.next = None
-
-        self.transform.dx = 1
-        self.transform.dy = 1
-        if self.transform.transpose_xy:
-            self.area.x2 = height
-            self.area.y2 = width
-            if self.transform.mirror_x:
-                self.transform.x = height
-                self.transform.dx = -1
-            if self.transform.mirror_y:
-                self.transform.y = width
-                self.transform.dy = -1
-        else:
-            self.area.x2 = width
-            self.area.y2 = height
-            if self.transform.mirror_x:
-                self.transform.x = width
-                self.transform.dx = -1
-            if self.transform.mirror_y:
-                self.transform.y = height
-                self.transform.dy = -1
+        self.area.x2 = width
+        self.area.y2 = height
+
+        transform = self.transform
+        transform.scale = 1
+        transform.transpose_xy = transpose_xy
+        transform.mirror_x = mirror_x
+        transform.mirror_y = mirror_y
+        transform.x = width if mirror_x else 0
+        transform.y = height if mirror_y else 0
+        transform.dx = -1 if mirror_x else 1
+        transform.dy = -1 if mirror_y else 1
 
     def set_root_group(self, root_group: Group) -> bool:
         """
@@ -182,7 +270,7 @@ class _DisplayCore:
         """
         # pylint: disable=protected-access
 
-        if root_group == self.current_group:
+        if root_group is self.current_group:
             return True
 
         if root_group is not None and root_group._in_group:
@@ -208,7 +296,7 @@ class _DisplayCore:
             return False
 
         self.refresh_in_progress = True
-        self.last_refresh = time.monotonic() * 1000
+        self.last_refresh = time.monotonic_ns() // 1_000_000
         return True
 
     def finish_refresh(self) -> None:
@@ -220,7 +308,13 @@ class _DisplayCore:
 
         self.full_refresh = False
         self.refresh_in_progress = False
-        self.last_refresh = time.monotonic() * 1000
+        self.last_refresh = time.monotonic_ns() // 1_000_000
+
+    def _bus_reset(self) -> None:
+        """Reset the bus, which also resets the controller's window"""
+        self._last_column_bounds = None
+        self._last_row_bounds = None
+        self._reset()
 
     def release_display_core(self) -> None:
         """Release the display from the current group"""
@@ -251,126 +345,132 @@ class _DisplayCore:
 
         # Expand the area if we have multiple pixels per byte and we need to byte
         # align the bounds
-        if self.colorspace.depth < 8:
-            pixels_per_byte = (
-                8 // self.colorspace.depth * self.colorspace.bytes_per_cell
-            )
-            if self.colorspace.pixels_in_byte_share_row:
-                if clipped.x1 % pixels_per_byte != 0:
-                    clipped.x1 -= clipped.x1 % pixels_per_byte
-                if clipped.x2 % pixels_per_byte != 0:
-                    clipped.x2 += pixels_per_byte - clipped.x2 % pixels_per_byte
-            else:
-                if clipped.y1 % pixels_per_byte != 0:
-                    clipped.y1 -= clipped.y1 % pixels_per_byte
-                if clipped.y2 % pixels_per_byte != 0:
-                    clipped.y2 += pixels_per_byte - clipped.y2 % pixels_per_byte
+        column_divisor = self._column_divisor
+        if column_divisor > 1:
+            clipped.x1 -= clipped.x1 % column_divisor
+            clipped.x2 += -clipped.x2 % column_divisor
+        row_divisor = self._row_divisor
+        if row_divisor > 1:
+            clipped.y1 -= clipped.y1 % row_divisor
+            clipped.y2 += -clipped.y2 % row_divisor
 
         return True
 
     def set_region_to_update(self, area: Area) -> None:
         """Set the region to update"""
-        region_x1 = area.x1 + self.colstart
-        region_x2 = area.x2 + self.colstart
-        region_y1 = area.y1 + self.rowstart
-        region_y2 = area.y2 + self.rowstart
-
-        if self.colorspace.depth < 8:
-            pixels_per_byte = 8 // self.colorspace.depth
-            if self.colorspace.pixels_in_byte_share_row:
-                region_x1 //= pixels_per_byte * self.colorspace.bytes_per_cell
-                region_x2 //= pixels_per_byte * self.colorspace.bytes_per_cell
-            else:
-                region_y1 //= pixels_per_byte * self.colorspace.bytes_per_cell
-                region_y2 //= pixels_per_byte * self.colorspace.bytes_per_cell
-        region_x2 -= 1
-        region_y2 -= 1
-
-        chip_select = CHIP_SELECT_UNTOUCHED
-        if self.always_toggle_chip_select or self.data_as_commands:
-            chip_select = CHIP_SELECT_TOGGLE_EVERY_BYTE
-
-        # Set column
-        self.begin_transaction()
-        data = bytearray([self.column_command])
-        data_type = DISPLAY_DATA
-        if not self.data_as_commands:
-            self.send(DISPLAY_COMMAND, CHIP_SELECT_UNTOUCHED, data)
-            data = bytearray(0)
-        else:
-            data_type = DISPLAY_COMMAND
+        self._begin_transaction()
+        self.send_region_commands(area)
+        self._end_transaction()
 
-        if self.ram_width < 0x100:  # Single Byte Bounds
-            data += struct.pack(">BB", region_x1, region_x2)
-        else:
-            if self.address_little_endian:
-                region_x1 = bswap16(region_x1)
-                region_x2 = bswap16(region_x2)
-            data += struct.pack(">HH", region_x1, region_x2)
-
-        # Quirk for SH1107 "SH1107_addressing"
-        #     Column lower command = 0x00, Column upper command = 0x10
-        if self.sh1107_addressing:
-            data = struct.pack(
-                ">BB",
-                ((region_x1 >> 4) & 0xF0) | 0x10,  # 0x10 to 0x17
-                region_x1 & 0x0F,  # 0x00 to 0x0F
-            )
+    def send_region_commands(self, area: Area) -> None:
+        """Send the commands that set the region to update. The caller is expected
+        to have already begun a transaction so they can share it with the pixel data.
+        """
+        column_divisor = self._column_divisor
+        row_divisor = self._row_divisor
+        region_x1 = (area.x1 + self.colstart) // column_divisor
+        region_x2 = (area.x2 + self.colstart) // column_divisor - 1
+        region_y1 = (area.y1 + self.rowstart) // row_divisor
+        region_y2 = (area.y2 + self.rowstart) // row_divisor - 1
 
-        self.send(data_type, chip_select, data)
-        self.end_transaction()
+        self._send_region(region_x1, region_x2, region_y1, region_y2)
 
-        if self.set_current_column_command != NO_COMMAND:
-            self.begin_transaction()
-            self.send(
-                DISPLAY_COMMAND, chip_select, bytes([self.set_current_column_command])
-            )
-            # Only send the first half of data because it is the first coordinate.
-            self.send(DISPLAY_DATA, chip_select, data[: len(data) // 2])
-            self.end_transaction()
-
-        # Set row
-        self.begin_transaction()
-        data = bytearray([self.row_command])
-
-        if not self.data_as_commands:
-            self.send(DISPLAY_COMMAND, CHIP_SELECT_UNTOUCHED, data)
-            data = bytearray(0)
-        if self.ram_height < 0x100:  # Single Byte Bounds
-            data += struct.pack(">BB", region_y1, region_y2)
-        else:
-            if self.address_little_endian:
-                region_y1 = bswap16(region_y1)
-                region_y2 = bswap16(region_y2)
-            data += struct.pack(">HH", region_y1, region_y2)
-
-        # Quirk for SH1107 "SH1107_addressing"
-        #     Page address command = 0xB0
-        if self.sh1107_addressing:
-            data = struct.pack(">B", 0xB0 | region_y1)
-
-        self.send(data_type, chip_select, data)
-        self.end_transaction()
-
-        if self.set_current_row_command != NO_COMMAND:
-            self.begin_transaction()
-            self.send(
-                DISPLAY_COMMAND, chip_select, bytes([self.set_current_row_command])
-            )
-            # Only send the first half of data because it is the first coordinate.
-            self.send(DISPLAY_DATA, chip_select, data[: len(data) // 2])
-            self.end_transaction()
+    def _send_region_as_data(
+        self, region_x1: int, region_x2: int, region_y1: int, region_y2: int
+    ) -> None:
+        """Set the region on a controller that takes command parameters as data. The
+        window persists on the controller, so it is only sent when it changes."""
+        bus = self._bus
+        if getattr(bus, "_commands_sent", False):
+            # The window may have been changed or reset behind the display's back
+            bus._commands_sent = False  # pylint: disable=protected-access
+            self._last_column_bounds = None
+            self._last_row_bounds = None
+        self._last_column_bounds = self._send_window_axis(
+            self._column_command,
+            self._set_current_column_command,
+            self._column_bounds.pack(region_x1, region_x2),
+            self._last_column_bounds,
+        )
+        self._last_row_bounds = self._send_window_axis(
+            self._row_command,
+            self._set_current_row_command,
+            self._row_bounds.pack(region_y1, region_y2),
+            self._last_row_bounds,
+        )
 
-    def send(
+    def _send_window_axis(
         self,
-        data_type: int,
-        chip_select: int,
-        data: ReadableBuffer,
+        command: bytes,
+        set_current_command: Optional[bytes],
+        bounds: bytes,
+        last_bounds: Optional[bytes],
+    ) -> bytes:
+        """Send one axis of the window unless it matches the bounds last sent, then
+        the current position if the controller has one. Returns the bounds."""
+        if bounds != last_bounds:
+            self._send(DISPLAY_COMMAND, CHIP_SELECT_UNTOUCHED, command)
+            self._send(DISPLAY_DATA, self._region_chip_select, bounds)
+        if set_current_command is not None:
+            self._send_current_position(set_current_command, bounds)
+        return bounds
+
+    def _send_region_as_commands(
+        self, region_x1: int, region_x2: int, region_y1: int, region_y2: int
     ) -> None:
-        """
-        Send the data to the current bus
-        """
-        self._send(data_type, chip_select, data)
+        """Set the region on a controller that takes parameters as commands. The column
+        commands are held back and sent with the row's so the region goes out in one
+        write."""
+        send = self._send
+        chip_select = self._region_chip_select
+
+        column_commands = self._column_command + self._column_bounds.pack(
+            region_x1, region_x2
+        )
+        if self._set_current_column_command is not None:
+            send(DISPLAY_COMMAND, chip_select, column_commands)
+            self._send_current_position(
+                self._set_current_column_command, column_commands
+            )
+            column_commands = b""
+
+        data = self._row_command + self._row_bounds.pack(region_y1, region_y2)
+        send(DISPLAY_COMMAND, chip_select, column_commands + data)
+        if self._set_current_row_command is not None:
+            self._send_current_position(self._set_current_row_command, data)
+
+    def _send_region_sh1107(
+        self, region_x1: int, _region_x2: int, region_y1: int, _region_y2: int
+    ) -> None:
+        """Set the region with SH1107 addressing, which only takes a start position:
+        column upper (0x10 to 0x17) and lower (0x00 to 0x0F) commands and a page
+        address command (0xB0)."""
+        send = self._send
+        chip_select = self._region_chip_select
+
+        column = bytes((((region_x1 >> 4) & 0x0F) | 0x10, region_x1 & 0x0F))
+        page = bytes((0xB0 | region_y1,))
+        if self.data_as_commands:
+            if self._set_current_column_command is not None:
+                send(DISPLAY_COMMAND, chip_select, column)
+                self._send_current_position(self._set_current_column_command, column)
+                column = b""
+            send(DISPLAY_COMMAND, chip_select, column + page)
+        else:
+            send(DISPLAY_COMMAND, CHIP_SELECT_UNTOUCHED, self._column_command)
+            send(DISPLAY_DATA, chip_select, column)
+            if self._set_current_column_command is not None:
+                self._send_current_position(self._set_current_column_command, column)
+            send(DISPLAY_COMMAND, CHIP_SELECT_UNTOUCHED, self._row_command)
+            send(DISPLAY_DATA, chip_select, page)
+        if self._set_current_row_command is not None:
+            self._send_current_position(self._set_current_row_command, page)
+
+    def _send_current_position(self, command: bytes, data: bytes) -> None:
+        """Send a set current position command for the start of the region"""
+        self._send(DISPLAY_COMMAND, self._region_chip_select, command)
+        # Only send the first half of data because it is the first coordinate.
+        self._send(DISPLAY_DATA, self._region_chip_select, data[: len(data) // 2])
 
     def bus_free(self) -> bool:
         """
@@ -378,18 +478,6 @@ class _DisplayCore:
         """
         return self._bus_free()
 
-    def begin_transaction(self) -> bool:
-        """
-        Begin Bus Transaction
-        """
-        return self._begin_transaction()
-
-    def end_transaction(self) -> None:
-        """
-        End Bus Transaction
-        """
-        self._end_transaction()
-
     def get_width(self) -> int:
         """
         Gets the width of the display in pixels.
@@ -58,6 +58,7 @@ class Group:
         self._supported_types = (TileGrid, Group, _VectorShape)
         self._in_group = False
         self._item_removed = False
+        self._dirty_area = Area()
         self._absolute_transform = TransformStruct(0, 0, 1, 1, 1, False, False, False)
         self._set_scale(scale)  # Set the scale via the setter
 
@@ -69,18 +70,16 @@ class Group:
             y = self._group_y
             if parent_transform.transpose_xy:
                 x, y = y, x
-            self._absolute_transform.x = int(
-                parent_transform.x + parent_transform.dx * x
-            )
-            self._absolute_transform.y = int(
-                parent_transform.y + parent_transform.dy * y
-            )
-            self._absolute_transform.dx = parent_transform.dx * self._scale
-            self._absolute_transform.dy = parent_transform.dy * self._scale
-            self._absolute_transform.transpose_xy = parent_transform.transpose_xy
-            self._absolute_transform.mirror_x = parent_transform.mirror_x
-            self._absolute_transform.mirror_y = parent_transform.mirror_y
-            self._absolute_transform.scale = parent_transform.scale * self._scale
+            transform = self._absolute_transform
+            scale = self._scale
+            transform.x = int(parent_transform.x + parent_transform.dx * x)
+            transform.y = int(parent_transform.y + parent_transform.dy * y)
+            transform.dx = parent_transform.dx * scale
+            transform.dy = parent_transform.dy * scale
+            transform.transpose_xy = parent_transform.transpose_xy
+            transform.mirror_x = parent_transform.mirror_x
+            transform.mirror_y = parent_transform.mirror_y
+            transform.scale = parent_transform.scale * scale
         self._update_child_transforms()
 
     def _update_child_transforms(self):
@@ -92,8 +91,48 @@ class Group:
     def _removal_cleanup(self, index):
         # pylint: disable=protected-access
         layer = self._layers[index]
+        layer_area = Area()
+        if isinstance(layer, _VectorShape):
+            rendered_last_frame = layer._get_dirty_area(layer_area)
+        else:
+            rendered_last_frame = layer._get_previous_area(layer_area)
         layer._update_transform(None)
 
+        # Whatever the layer covered last frame needs to be redrawn without it
+        if not rendered_last_frame:
+            return
+        if not self._item_removed:
+            layer_area.copy_into(self._dirty_area)
+        else:
+            self._dirty_area.union(layer_area, self._dirty_area)
+        self._item_removed = True
+
+    def _get_previous_area(self, area: Area) -> bool:
+        """Get the area covered by the group last frame. Returns False if it
+        didn't draw anything."""
+        # pylint: disable=protected-access
+        first = True
+        layer_area = Area()
+        for layer in self._layers:
+            if isinstance(layer, _VectorShape):
+                has_area = layer._get_dirty_area(layer_area)
+            else:
+                has_area = layer._get_previous_area(layer_area)
+            if not has_area:
+                continue
+            if first:
+                layer_area.copy_into(area)
+                first = False
+            else:
+                area.union(layer_area, area)
+        if self._item_removed:
+            if first:
+                self._dirty_area.copy_into(area)
+                first = False
+            else:
+                area.union(self._dirty_area, area)
+        return not first
+
     def _layer_update(self, index):
         # pylint: disable=protected-access
         layer = self._layers[index]
@@ -129,8 +168,7 @@ class Group:
     def remove(self, layer: Union[Group, TileGrid, _VectorShape]) -> None:
         """Remove the first copy of layer. Raises ValueError
         if it is not present."""
-        index = self.index(layer)
-        self._layers.pop(index)
+        self.pop(self.index(layer))
 
     def __bool__(self) -> bool:
         """Returns if there are any layers"""
@@ -148,12 +186,15 @@ class Group:
         self, index: int, value: Union[Group, TileGrid, _VectorShape]
     ) -> None:
         """Sets the value at the given index."""
+        if not isinstance(value, self._supported_types):
+            raise ValueError("Invalid Group Member")
         self._removal_cleanup(index)
         self._layers[index] = value
         self._layer_update(index)
 
     def __delitem__(self, index: int) -> None:
         """Deletes the value at the given index."""
+        self._removal_cleanup(index)
         del self._layers[index]
 
     def _fill_area(
@@ -164,12 +205,12 @@ class Group:
         buffer: WriteableBuffer,
     ) -> bool:
         if not self._hidden_group:
+            # Layers are validated when added, so every one can fill
             for layer in reversed(self._layers):
-                if isinstance(layer, (Group, TileGrid, _VectorShape)):
-                    if layer._fill_area(  # pylint: disable=protected-access
-                        colorspace, area, mask, buffer
-                    ):
-                        return True
+                if layer._fill_area(  # pylint: disable=protected-access
+                    colorspace, area, mask, buffer
+                ):
+                    return True
         return False
 
     def sort(self, key: Callable, reverse: bool) -> None:
@@ -177,12 +218,14 @@ class Group:
         self._layers.sort(key=key, reverse=reverse)
 
     def _finish_refresh(self):
+        self._item_removed = False
         for layer in reversed(self._layers):
-            if isinstance(layer, (Group, TileGrid, _VectorShape)):
-                layer._finish_refresh()  # pylint: disable=protected-access
+            layer._finish_refresh()  # pylint: disable=protected-access
 
     def _get_refresh_areas(self, areas: list[Area]) -> None:
         # pylint: disable=protected-access
+        if self._item_removed:
+            areas.append(self._dirty_area)
         for layer in reversed(self._layers):
             if isinstance(layer, (Group, _VectorShape)):
                 layer._get_refresh_areas(areas)
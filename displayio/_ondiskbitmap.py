@@ -18,8 +18,8 @@ displayio for Blinka
 
 """
 
+import struct
 from typing import Union, BinaryIO
-from ._helpers import read_word
 from ._colorconverter import ColorConverter
 from ._colorspace import Colorspace
 from ._palette import Palette
@@ -27,6 +27,36 @@ from ._palette import Palette
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_Blinka_displayio.git"
 
+# The file header and the DIB header fields read from it, through the color
+# bitmasks: signature, data offset, header size, width, height, bits per pixel,
+# compression, number of colors and the red, green and blue bitmasks
+_BMP_HEADER = struct.Struct("<2s8xIIII2xHI12xI4xIII")
+
+# For 1, 2 and 4 bit pixels, one translate table per pixel in a byte that maps
+# the byte to that pixel's palette index, leftmost pixel first
+_UNPACK_TABLES = {
+    bits: tuple(
+        bytes(
+            (byte >> (8 - bits * (pixel + 1))) & ((1 << bits) - 1)
+            for byte in range(256)
+        )
+        for pixel in range(8 // bits)
+    )
+    for bits in (1, 2, 4)
+}
+
+
+def _bitfield(mask: int, position: int) -> tuple[int, int, int]:
+    """Return the mask and the right and left shifts that move a 16-bit pixel's
+    color field into the top bits of the RGB888 byte at the given position."""
+    if not mask:
+        return 0, 0, 0
+    low = (mask & -mask).bit_length() - 1
+    width = mask.bit_length() - low
+    # Fields wider than 8 bits keep only their top 8 bits
+    dropped = max(width - 8, 0)
+    return mask, low + dropped, position + 8 - (width - dropped)
+
 
 class OnDiskBitmap:
     # pylint: disable=too-many-instance-attributes
@@ -88,40 +118,43 @@ class OnDiskBitmap:
         try:
             self._file = file
             file.seek(0)
-            bmp_header = memoryview(file.read(138)).cast(
-                "H"
-            )  # cast as unsigned 16-bit int
-
-            if len(bmp_header.tobytes()) != 138 or bmp_header.tobytes()[0:2] != b"BM":
+            bmp_header = file.read(138)
+            if len(bmp_header) != 138:
+                raise ValueError("Invalid BMP file")
+            (
+                signature,
+                self._data_offset,
+                header_size,
+                self._width,
+                self._height,
+                bits_per_pixel,
+                compression,
+                number_of_colors,
+                r_bitmask,
+                g_bitmask,
+                b_bitmask,
+            ) = _BMP_HEADER.unpack_from(bmp_header)
+            if signature != b"BM":
                 raise ValueError("Invalid BMP file")
-
-            self._data_offset = read_word(bmp_header, 5)
-
-            header_size = read_word(bmp_header, 7)
-            bits_per_pixel = bmp_header[14]
-            compression = read_word(bmp_header, 15)
-            number_of_colors = read_word(bmp_header, 23)
 
             indexed = bits_per_pixel <= 8
             self._bitfield_compressed = compression == 3
             self._bits_per_pixel = bits_per_pixel
-            self._width = read_word(bmp_header, 9)
-            self._height = read_word(bmp_header, 11)
 
             self._pixel_shader_base = ColorConverter(
                 input_colorspace=Colorspace.RGB888, dither=False
             )
 
             if bits_per_pixel == 16:
-                if header_size >= 56 or self._bitfield_compressed:
-                    self._r_bitmask = read_word(bmp_header, 27)
-                    self._g_bitmask = read_word(bmp_header, 29)
-                    self._b_bitmask = read_word(bmp_header, 31)
-                else:
+                if not (header_size >= 56 or self._bitfield_compressed):
                     # No compression or short header mean 5:5:5
-                    self._r_bitmask = 0x7C00
-                    self._g_bitmask = 0x03E0
-                    self._b_bitmask = 0x001F
+                    r_bitmask = 0x7C00
+                    g_bitmask = 0x03E0
+                    b_bitmask = 0x001F
+                # Work out each field's shifts once rather than on every pixel
+                self._red = _bitfield(r_bitmask, 16)
+                self._green = _bitfield(g_bitmask, 8)
+                self._blue = _bitfield(b_bitmask, 0)
             elif indexed:
                 if number_of_colors == 0:
                     number_of_colors = 1 << bits_per_pixel
@@ -134,19 +167,17 @@ class OnDiskBitmap:
 
                     file.seek(palette_offset)
 
-                    palette_data = memoryview(file.read(palette_size)).cast(
-                        "I"
-                    )  # cast as unsigned 32-bit int
-                    if len(palette_data.tobytes()) != palette_size:
+                    palette_data = file.read(palette_size)
+                    if len(palette_data) != palette_size:
                         raise ValueError("Unable to read color palette data")
 
-                    for i in range(number_of_colors):
-                        palette._set_color(
-                            palette_data[i], i
-                        )  # pylint: disable=protected-access
+                    # Read every entry at once as unsigned 32-bit ints
+                    # pylint: disable=protected-access
+                    for i, color in enumerate(memoryview(palette_data).cast("I")):
+                        palette._set_color(i, color)
                 else:
-                    palette._set_color(0x000000, 0)  # pylint: disable=protected-access
-                    palette._set_color(0xFFFFFF, 1)  # pylint: disable=protected-access
+                    palette._set_color(0, 0x000000)  # pylint: disable=protected-access
+                    palette._set_color(1, 0xFFFFFF)  # pylint: disable=protected-access
                 self._pixel_shader_base = palette
             elif header_size not in (12, 40, 108, 124):
                 raise ValueError(
@@ -164,6 +195,8 @@ class OnDiskBitmap:
                 self._bits_per_pixel // 8 if (self._bits_per_pixel // 8) else 1
             )
             pixels_per_byte = 8 // self._bits_per_pixel
+            self._bytes_per_pixel = bytes_per_pixel
+            self._pixels_per_byte = pixels_per_byte
             if pixels_per_byte == 0:
                 self._stride = self._width * bytes_per_pixel
                 if self._stride % 4 != 0:
@@ -173,6 +206,37 @@ class OnDiskBitmap:
                 if bit_stride % 32 != 0:
                     bit_stride += 32 - bit_stride % 32
                 self._stride = bit_stride // 8
+
+            # Pixels are read a bitmap row at a time, so keep the last row read
+            # rather than seeking and reading the file for every pixel
+            self._row = bytearray(self._stride)
+            self._row_pixel_count = 0
+            self._row_y = -1
+            # Every pixel is read with a single index into a view of the row.
+            # Pixels smaller than a byte are first unpacked a byte each, and 24 bit
+            # rows are widened to 32 bits, using C level translates and slice copies.
+            self._row_words = None
+            self._unpack_tables = _UNPACK_TABLES.get(self._bits_per_pixel)
+            # The pixel format is fixed, so _get_pixel is bound to the reader for
+            # it here rather than choosing one on every pixel
+            self._get_pixel = self._get_row_pixel
+            self._word_mask = 0xFFFFFFFF
+            if self._unpack_tables is not None:
+                self._row_words = bytearray(self._stride * pixels_per_byte)
+                self._row_pixels = self._row_words
+            elif bytes_per_pixel == 1:
+                self._row_pixels = self._row
+            elif bytes_per_pixel == 2:
+                self._row_pixels = memoryview(self._row).cast("H")
+                self._get_pixel = self._get_bitfield_pixel
+            else:
+                if bytes_per_pixel == 3:
+                    self._row_words = bytearray(self._width * 4)
+                    self._row_pixels = memoryview(self._row_words).cast("I")
+                else:
+                    self._row_pixels = memoryview(self._row).cast("I")
+                    if self._bitfield_compressed:
+                        self._word_mask = 0xFFFFFF
         except IOError as error:
             raise OSError from error
 
@@ -208,53 +272,56 @@ class OnDiskBitmap:
 
         return self._pixel_shader_base
 
-    def _get_pixel(self, x: int, y: int) -> int:
-        if not (0 <= x < self.width and 0 <= y < self.height):
+    def _read_row(self, y: int) -> None:
+        """Read bitmap row y from the file"""
+        self._file.seek(self._data_offset + (self._height - y - 1) * self._stride)
+        row_length = self._file.readinto(self._row) or 0
+        self._row_y = y
+        # Pixels past the end of a truncated file read as 0
+        if self._pixels_per_byte:
+            self._row_pixel_count = row_length * self._pixels_per_byte
+        else:
+            self._row_pixel_count = row_length // self._bytes_per_pixel
+        row = self._row
+        words = self._row_words
+        if self._unpack_tables is not None:
+            pixels_per_byte = self._pixels_per_byte
+            for pixel, table in enumerate(self._unpack_tables):
+                words[pixel::pixels_per_byte] = row.translate(table)
+        elif words is not None:
+            end = self._width * 3
+            words[0::4] = row[0:end:3]
+            words[1::4] = row[1:end:3]
+            words[2::4] = row[2:end:3]
+
+    def _get_bitfield_pixel(self, x: int, y: int) -> int:
+        """Read a 16 bit pixel as RGB888"""
+        if not (0 <= x < self._width and 0 <= y < self._height):
             return 0
-
-        bytes_per_pixel = (
-            self._bits_per_pixel // 8 if (self._bits_per_pixel // 8) else 1
+        if y != self._row_y:
+            self._read_row(y)
+        if x >= self._row_pixel_count:
+            return 0
+        pixel = self._row_pixels[x]
+        # Each field is (mask, right shift, left shift)
+        red = self._red
+        green = self._green
+        blue = self._blue
+        return (
+            (pixel & red[0]) >> red[1] << red[2]
+            | (pixel & green[0]) >> green[1] << green[2]
+            | (pixel & blue[0]) >> blue[1] << blue[2]
         )
-        pixels_per_byte = 8 // self._bits_per_pixel
-        if pixels_per_byte == 0:
-            location = (
-                self._data_offset
-                + (self.height - y - 1) * self._stride
-                + x * bytes_per_pixel
-            )
-        else:
-            location = (
-                self._data_offset
-                + (self.height - y - 1) * self._stride
-                + x // pixels_per_byte
-            )
 
-        self._file.seek(location)
-
-        pixel_data = self._file.read(bytes_per_pixel)
-        if len(pixel_data) == bytes_per_pixel:
-            if bytes_per_pixel == 1:
-                offset = (x % pixels_per_byte) * self._bits_per_pixel
-                mask = (1 << self._bits_per_pixel) - 1
-                return (pixel_data[0] >> ((8 - self._bits_per_pixel) - offset)) & mask
-            if bytes_per_pixel == 2:
-                pixel_data = pixel_data[0] | pixel_data[1] << 8
-                if self._g_bitmask == 0x07E0:  # 565
-                    red = (pixel_data & self._r_bitmask) >> 11
-                    green = (pixel_data & self._g_bitmask) >> 5
-                    blue = pixel_data & self._b_bitmask
-                else:  # 555
-                    red = (pixel_data & self._r_bitmask) >> 10
-                    green = (pixel_data & self._g_bitmask) >> 4
-                    blue = pixel_data & self._b_bitmask
-                return red << 19 | green << 10 | blue << 3
-            if bytes_per_pixel == 4 and self._bitfield_compressed:
-                return pixel_data[0] | pixel_data[1] << 8 | pixel_data[2] << 16
-            pixel = pixel_data[0] | pixel_data[1] << 8 | pixel_data[2] << 16
-            if bytes_per_pixel == 4:
-                pixel |= pixel_data[3] << 24
-            return pixel
-        return 0
+    def _get_row_pixel(self, x: int, y: int) -> int:
+        """Read a palette index or a 24 or 32 bit pixel"""
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return 0
+        if y != self._row_y:
+            self._read_row(y)
+        if x >= self._row_pixel_count:
+            return 0
+        return self._row_pixels[x] & self._word_mask
 
     def _finish_refresh(self) -> None:
         pass
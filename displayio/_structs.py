@@ -23,7 +23,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_Blinka_Displayio.git"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformStruct:
     # pylint: disable=invalid-name
     """Transform Struct Dataclass"""
@@ -39,7 +39,7 @@ class TransformStruct:
     transpose_xy: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorspaceStruct:
     # pylint: disable=invalid-name, too-many-instance-attributes
     """Colorspace Struct Dataclass"""
@@ -57,7 +57,7 @@ class ColorspaceStruct:
     dither: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class InputPixelStruct:
     """InputPixel Struct Dataclass"""
 
@@ -69,7 +69,7 @@ class InputPixelStruct:
     tile_y: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputPixelStruct:
     """OutputPixel Struct Dataclass"""
 
@@ -77,7 +77,7 @@ class OutputPixelStruct:
     opaque: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorStruct:
     """Color Struct Dataclass"""
 
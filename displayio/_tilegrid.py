@@ -17,7 +17,6 @@ displayio for Blinka
 
 """
 
-import struct
 from typing import Union, Optional, Tuple
 from circuitpython_typing import WriteableBuffer
 from ._bitmap import Bitmap
@@ -113,6 +112,9 @@ class TileGrid:
         self._current_area = Area(0, 0, self._pixel_width, self._pixel_height)
         self._dirty_area = Area(0, 0, 0, 0)
         self._previous_area = Area(0xFFFF, 0xFFFF, 0xFFFF, 0xFFFF)
+        # Scratch areas for _fill_area so each subrectangle doesn't allocate
+        self._overlap_area = Area()
+        self._transformed_area = Area()
         self._moved = False
         self._full_change = True
         self._partial_change = True
@@ -243,7 +245,7 @@ class TileGrid:
 
         if self._hidden_tilegrid or self._hidden_by_parent:
             return False
-        overlap = Area()  # area, current_area, overlap
+        overlap = self._overlap_area  # area, current_area, overlap
         if not area.compute_overlap(self._current_area, overlap):
             return False
         # else:
@@ -273,7 +275,7 @@ class TileGrid:
         # layers at that point.
         full_coverage = area == overlap
 
-        transformed = Area()
+        transformed = self._transformed_area
         area.transform_within(
             flip_x != (self._absolute_transform.dx < 0),
             flip_y != (self._absolute_transform.dy < 0),
@@ -302,38 +304,56 @@ class TileGrid:
             x_stride, y_stride = y_stride, x_stride
             x_shift, y_shift = y_shift, x_shift
 
-        pixels_per_byte = 8 // colorspace.depth
+        # Colorspace settings are fixed for the whole fill, so read them once
+        depth = colorspace.depth
+        pixels_per_byte = 8 // depth
+        pixels_share_row = colorspace.pixels_in_byte_share_row
+        reverse_pixels = colorspace.reverse_pixels_in_byte
+        leftmost_shift = (pixels_per_byte - 1) * depth
+        area_width = area.width()
 
         input_pixel = InputPixelStruct()
         output_pixel = OutputPixelStruct()
+        # Views of the word buffer for each pixel size, made once rather than per pixel
+        buffer_bytes = buffer.cast("B")
+        buffer_halfwords = buffer_bytes.cast("H")
+        scale = self._absolute_transform.scale
+        tile_width = self._tile_width
+        tile_height = self._tile_height
+        width_in_tiles = self._width_in_tiles
+        bitmap_width_in_tiles = self._bitmap_width_in_tiles
         for input_pixel.y in range(start_y, end_y):
-            row_start = (
-                start + (input_pixel.y - start_y + y_shift) * y_stride
+            # Walk the destination by stride; the rotation only changes the strides
+            walk_offset = (
+                start
+                + (input_pixel.y - start_y + y_shift) * y_stride
+                + x_shift * x_stride
+                - x_stride
             )  # In Pixels
-            local_y = input_pixel.y // self._absolute_transform.scale
+            local_y = input_pixel.y // scale
+            tile_row = (
+                (local_y // tile_height + self._top_left_y) % self._height_in_tiles
+            ) * width_in_tiles
+            y_in_tile = local_y % tile_height
             for input_pixel.x in range(start_x, end_x):
                 # Compute the destination pixel in the buffer and mask based on the transformations
-                offset = (
-                    row_start + (input_pixel.x - start_x + x_shift) * x_stride
-                )  # In Pixels
+                walk_offset += x_stride
+                offset = walk_offset
 
                 # Check the mask first to see if the pixel has already been set
                 if mask[offset // 32] & (1 << (offset % 32)):
                     continue
-                local_x = input_pixel.x // self._absolute_transform.scale
-                tile_location = (
-                    (local_y // self._tile_height + self._top_left_y)
-                    % self._height_in_tiles
-                ) * self._width_in_tiles + (
-                    local_x // self._tile_width + self._top_left_x
-                ) % self._width_in_tiles
-                input_pixel.tile = tiles[tile_location]
+                local_x = input_pixel.x // scale
+                input_pixel.tile = tiles[
+                    tile_row
+                    + (local_x // tile_width + self._top_left_x) % width_in_tiles
+                ]
                 input_pixel.tile_x = (
-                    input_pixel.tile % self._bitmap_width_in_tiles
-                ) * self._tile_width + local_x % self._tile_width
+                    input_pixel.tile % bitmap_width_in_tiles
+                ) * tile_width + local_x % tile_width
                 input_pixel.tile_y = (
-                    input_pixel.tile // self._bitmap_width_in_tiles
-                ) * self._tile_height + local_y % self._tile_height
+                    input_pixel.tile // bitmap_width_in_tiles
+                ) * tile_height + y_in_tile
 
                 output_pixel.pixel = 0
                 input_pixel.pixel = 0
@@ -363,41 +383,32 @@ class TileGrid:
                     full_coverage = False
                 else:
                     mask[offset // 32] |= 1 << (offset % 32)
-                    if colorspace.depth == 16:
-                        struct.pack_into(
-                            "H",
-                            buffer.cast("B"),
-                            offset * 2,
-                            output_pixel.pixel,
-                        )
-                    elif colorspace.depth == 32:
-                        struct.pack_into(
-                            "I",
-                            buffer.cast("B"),
-                            offset * 4,
-                            output_pixel.pixel,
-                        )
-                    elif colorspace.depth == 8:
-                        buffer.cast("B")[offset] = output_pixel.pixel & 0xFF
-                    elif colorspace.depth < 8:
+                    if depth == 16:
+                        buffer_halfwords[offset] = output_pixel.pixel
+                    elif depth == 32:
+                        buffer[offset] = output_pixel.pixel
+                    elif depth == 8:
+                        buffer_bytes[offset] = output_pixel.pixel & 0xFF
+                    elif depth < 8:
                         # Reorder the offsets to pack multiple rows into
                         # a byte (meaning they share a column).
-                        if not colorspace.pixels_in_byte_share_row:
-                            width = area.width()
-                            row = offset // width
-                            col = offset % width
+                        if not pixels_share_row:
+                            row = offset // area_width
+                            col = offset % area_width
                             # Dividing by pixels_per_byte does truncated division
                             # even if we multiply it back out
                             offset = (
                                 col * pixels_per_byte
-                                + (row // pixels_per_byte) * pixels_per_byte * width
+                                + (row // pixels_per_byte)
+                                * pixels_per_byte
+                                * area_width
                                 + (row % pixels_per_byte)
                             )
-                        shift = (offset % pixels_per_byte) * colorspace.depth
-                        if colorspace.reverse_pixels_in_byte:
+                        shift = (offset % pixels_per_byte) * depth
+                        if reverse_pixels:
                             # Reverse the shift by subtracting it from the leftmost shift
-                            shift = (pixels_per_byte - 1) * colorspace.depth - shift
-                        buffer.cast("B")[offset // pixels_per_byte] |= (
+                            shift = leftmost_shift - shift
+                        buffer_bytes[offset // pixels_per_byte] |= (
                             output_pixel.pixel << shift
                         )
 
@@ -439,12 +450,14 @@ class TileGrid:
             areas.append(self._previous_area)
             return
 
-        tail = areas[-1] if areas else None
         # If we have an in-memory bitmap, then check it for modifications
         if isinstance(self._bitmap, Bitmap):
+            area_count = len(areas)
             self._bitmap._get_refresh_areas(areas)  # pylint: disable=protected-access
-            refresh_area = areas[-1] if areas else None
-            if refresh_area != tail:
+            if len(areas) != area_count:
+                # The bitmap's area is in bitmap coordinates, so it is only used
+                # to work out what of ours to refresh and isn't refreshed itself.
+                refresh_area = areas.pop()
                 # Special case a TileGrid that shows a full bitmap and use its
                 # dirty area. Copy it to ours so we can transform it.
                 if self._tiles_in_bitmap == 1:
@@ -515,6 +528,14 @@ class TileGrid:
         if not hidden:
             self._full_change = True
 
+    def _get_previous_area(self, area: Area) -> bool:
+        """Get the area the tilegrid was drawn to last frame. Returns False if it
+        wasn't drawn."""
+        if self._previous_area.x1 == self._previous_area.x2:
+            return False
+        self._previous_area.copy_into(area)
+        return True
+
     def _get_rendered_hidden(self) -> bool:
         return self._rendered_hidden
 
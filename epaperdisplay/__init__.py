@@ -39,6 +39,9 @@ from displayio._constants import (
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_Blinka_displayio.git"
 
+# Translation table that flips every bit of a byte
+_INVERT_BITS = bytes(~value & 0xFF for value in range(256))
+
 
 class EPaperDisplay:
     # pylint: disable=too-many-instance-attributes, too-many-statements
@@ -221,17 +224,18 @@ class EPaperDisplay:
         )
         self._grayscale = grayscale
 
-        self._start_sequence = start_sequence
+        self._two_byte_sequence_length = two_byte_sequence_length
+        self._start_sequence = self._parse_command_sequence(start_sequence)
         self._start_up_time = start_up_time
-        self._stop_sequence = stop_sequence
-        self._refresh_sequence = refresh_sequence
+        self._stop_sequence = self._parse_command_sequence(stop_sequence)
+        self._refresh_sequence = self._parse_command_sequence(refresh_sequence)
         self._busy = None
-        self._two_byte_sequence_length = two_byte_sequence_length
         if busy_pin is not None:
             self._busy = DigitalInOut(busy_pin)
             self._busy.switch_to_input()
 
         self._ticks_disabled = False
+        self._refresh_areas = []
 
         # Clear the color memory if it isn't in use
         if highlight_color == 0x00 and write_color_ram_command != NO_COMMAND:
@@ -262,7 +266,7 @@ class EPaperDisplay:
     ) -> None:
         """Updates the ``start_sequence`` and ``seconds_per_frame`` parameters to enable
         varying the refresh mode of the display."""
-        self._start_sequence = bytearray(start_sequence)
+        self._start_sequence = self._parse_command_sequence(start_sequence)
         self._milliseconds_per_frame = seconds_per_frame * 1000
 
     def refresh(self) -> None:
@@ -339,7 +343,7 @@ class EPaperDisplay:
                 refresh_done = busy == self._busy_state
             else:
                 refresh_done = (
-                    time.monotonic() * 1000 - self._core.last_refresh
+                    time.monotonic_ns() // 1_000_000 - self._core.last_refresh
                     > self._refresh_time
                 )
 
@@ -350,20 +354,20 @@ class EPaperDisplay:
                 self._send_command_sequence(False, self._stop_sequence)
 
     def _get_refresh_areas(self) -> list[Area]:
-        """Get a list of areas to be refreshed"""
-        areas = []
+        """Get a list of areas to be refreshed. The list is reused between refreshes."""
+        areas = self._refresh_areas
+        areas.clear()
         if self._core.full_refresh:
             areas.append(self._core.area)
             return areas
-        first_area = None
         if self._core.current_group is not None:
             self._core.current_group._get_refresh_areas(  # pylint: disable=protected-access
                 areas
             )
-            first_area = areas[0]
-        if first_area is not None and self._core.row_command == NO_COMMAND:
+        if areas and self._core.row_command == NO_COMMAND:
             # Do a full refresh if the display doesn't support partial updates
-            areas = [self._core.area]
+            areas.clear()
+            areas.append(self._core.area)
         return areas
 
     def _refresh_area(self, area: Area) -> bool:
@@ -396,6 +400,9 @@ class EPaperDisplay:
 
         mask_length = (pixels_per_buffer // 32) + 1  # 1 bit per pixel + 1
 
+        # Reuse a single area for every subrectangle rather than allocating one each pass
+        subrectangle = Area(x1=clipped.x1, x2=clipped.x2)
+
         passes = 1
         if self._write_color_ram_command != NO_COMMAND:
             passes = 2
@@ -413,12 +420,8 @@ class EPaperDisplay:
             self._core.end_transaction()
 
             for subrect_index in range(subrectangles):
-                subrectangle = Area(
-                    x1=clipped.x1,
-                    y1=clipped.y1 + rows_per_buffer * subrect_index,
-                    x2=clipped.x2,
-                    y2=clipped.y1 + rows_per_buffer * (subrect_index + 1),
-                )
+                subrectangle.y1 = clipped.y1 + rows_per_buffer * subrect_index
+                subrectangle.y2 = subrectangle.y1 + rows_per_buffer
                 if remaining_rows < rows_per_buffer:
                     subrectangle.y2 = subrectangle.y1 + remaining_rows
                 remaining_rows -= rows_per_buffer
@@ -427,8 +430,8 @@ class EPaperDisplay:
                     8 // self._core.colorspace.depth
                 )
 
-                buffer = memoryview(bytearray([0] * (buffer_size * 4))).cast("I")
-                mask = memoryview(bytearray([0] * (mask_length * 4))).cast("I")
+                buffer = memoryview(bytearray(buffer_size * 4)).cast("I")
+                mask = memoryview(bytearray(mask_length * 4)).cast("I")
 
                 if not self._acep:
                     self._core.colorspace.grayscale = True
@@ -445,61 +448,58 @@ class EPaperDisplay:
                 else:
                     self._core.fill_area(subrectangle, mask, buffer)
 
-                # Invert it all
+                data = buffer.cast("B")[:subrectangle_size_bytes]
+                # Invert the bytes being sent in a single pass
                 if (pass_index == 1 and self._color_bits_inverted) or (
                     pass_index == 0 and self._black_bits_inverted
                 ):
-                    for i in range(buffer_size):
-                        buffer[i] = ~buffer[i]
+                    data[:] = data.tobytes().translate(_INVERT_BITS)
 
                 if not self._core.begin_transaction():
                     # Can't acquire display bus; skip the rest of the data. Try next display.
                     return False
-                self._core.send(
-                    DISPLAY_DATA,
-                    self._chip_select,
-                    buffer.tobytes()[:subrectangle_size_bytes],
-                )
+                self._core.send(DISPLAY_DATA, self._chip_select, data)
                 self._core.end_transaction()
         return True
 
-    def _send_command_sequence(
-        self, should_wait_for_busy: bool, sequence: ReadableBuffer
-    ) -> None:
+    def _parse_command_sequence(self, sequence: ReadableBuffer) -> tuple:
+        """Decode a command sequence once into (command, data, delay) tuples so it
+        can be replayed on every refresh without re-parsing"""
+        commands = []
         i = 0
         while i < len(sequence):
-            command = sequence[i]
+            command = bytes((sequence[i],))
             data_size = sequence[i + 1]
             delay = (data_size & DELAY) != 0
             data_size &= ~DELAY
-            data = sequence[i + 2 : i + 2 + data_size]
+            data_start = i + 2
             if self._two_byte_sequence_length:
-                data_size = ((data_size & ~DELAY) << 8) + sequence[i + 2]
-                data = sequence[i + 3 : i + 3 + data_size]
+                data_size = (data_size << 8) + sequence[i + 2]
+                data_start += 1
+            data = bytes(sequence[data_start : data_start + data_size])
+            i = data_start + data_size
 
-            self._core.begin_transaction()
-            self._core.send(
-                DISPLAY_COMMAND, CHIP_SELECT_TOGGLE_EVERY_BYTE, bytes([command])
-            )
-            if data_size > 0:
-                self._core.send(
-                    DISPLAY_DATA,
-                    CHIP_SELECT_UNTOUCHED,
-                    bytes(data),
-                )
-            self._core.end_transaction()
             delay_time_ms = 0
             if delay:
-                data_size += 1
-                delay_time_ms = sequence[i + 1 + data_size]
+                delay_time_ms = sequence[i]
                 if delay_time_ms == 255:
                     delay_time_ms = 500
-            time.sleep(delay_time_ms / 1000)
+                i += 1
+            commands.append((command, data, delay_time_ms / 1000))
+        return tuple(commands)
+
+    def _send_command_sequence(
+        self, should_wait_for_busy: bool, sequence: tuple
+    ) -> None:
+        for command, data, delay in sequence:
+            self._core.begin_transaction()
+            self._core.send(DISPLAY_COMMAND, CHIP_SELECT_TOGGLE_EVERY_BYTE, command)
+            if data:
+                self._core.send(DISPLAY_DATA, CHIP_SELECT_UNTOUCHED, data)
+            self._core.end_transaction()
+            time.sleep(delay)
             if should_wait_for_busy:
                 self._wait_for_busy()
-            i += 2 + data_size
-            if self._two_byte_sequence_length:
-                i += 1
 
     def _start_refresh(self) -> None:
         # Run start sequence
@@ -546,12 +546,8 @@ class EPaperDisplay:
     def rotation(self, value: int) -> None:
         if value % 90 != 0:
             raise ValueError("Display rotation must be in 90 degree increments")
-        transposed = self._core.rotation in (90, 270)
-        will_transposed = value in (90, 270)
-        if transposed != will_transposed:
-            self._core.width, self._core.height = self._core.height, self._core.width
-        self._core.set_rotation(value)
-        if self._core.current_group is not None:
+        # The scene's transforms only need rebuilding when the rotation changes
+        if self._core.set_rotation(value) and self._core.current_group is not None:
             self._core.current_group._update_transform(  # pylint: disable=protected-access
                 self._core.transform
             )
@@ -563,7 +559,7 @@ class EPaperDisplay:
             return 0
 
         # Refresh at seconds per frame rate
-        elapsed_time = time.monotonic() * 1000 - self._core.last_refresh
+        elapsed_time = time.monotonic_ns() // 1_000_000 - self._core.last_refresh
         if elapsed_time > self._milliseconds_per_frame:
             return 0
         return self._milliseconds_per_frame - elapsed_time
@@ -33,12 +33,27 @@ from displayio._constants import (
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_Blinka_displayio.git"
 
+# Writes larger than this are handed to busio in slices of this size, since SPI
+# ports copy the whole buffer they are given on every write.
+_SPI_WRITE_CHUNK = 4096
+
+
+def _output_setter(pin: digitalio.DigitalInOut):
+    """Return a function setting an output pin's level. Blinka pins are set
+    directly, skipping DigitalInOut's direction check on every write."""
+    raw_pin = getattr(pin, "_pin", None)
+    if callable(getattr(raw_pin, "value", None)):
+        return raw_pin.value
+    return lambda value: setattr(pin, "value", value)
+
 
 class FourWire:
     """Manage updating a display over SPI four wire protocol in the background while
     Python code runs. It doesn’t handle display initialization.
     """
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(
         self,
         spi_bus: busio.SPI,
@@ -65,6 +80,7 @@ class FourWire:
         if chip_select is not None:
             self._chip_select = digitalio.DigitalInOut(chip_select)
             self._chip_select.switch_to_output(value=True)
+            self._set_chip_select = _output_setter(self._chip_select)
         else:
             self._chip_select = None
 
@@ -79,6 +95,17 @@ class FourWire:
         else:
             self._reset = None
         self._spi = spi_bus
+        # send() writes each command byte through this one buffer
+        self._command_buffer = bytearray(1)
+        # Set when commands are sent or the controller is reset outside of a display
+        # refresh, so the display knows the controller state it last sent is stale
+        self._commands_sent = False
+
+        # busio's configure detects the board again on every call. Linux ports keep
+        # the settings they were last given, so it is skipped while those still
+        # match ours, which stays correct when other devices share the bus.
+        self._spi_port = getattr(spi_bus, "_spi", None)
+        self._port_settings = (baudrate, (polarity << 1) | phase, 8)
 
     def _release(self):
         self.reset()
@@ -95,6 +122,7 @@ class FourWire:
         """Performs a hardware reset via the reset pin.
         Raises an exception if called when no reset pin is available.
         """
+        self._commands_sent = True
         if self._reset is not None:
             self._reset.value = False
             time.sleep(0.001)
@@ -113,15 +141,16 @@ class FourWire:
         such as vertical scroll, set via ``send`` may or may not be reset once the code is
         done.
         """
-        if not 0 <= command <= 255:
-            raise ValueError("Command must be an int between 0 and 255")
+        # Storing the byte raises ValueError for commands outside 0-255
+        self._command_buffer[0] = command
         chip_select = (
             CHIP_SELECT_TOGGLE_EVERY_BYTE
             if toggle_every_byte
             else CHIP_SELECT_UNTOUCHED
         )
+        self._commands_sent = True
         self._begin_transaction()
-        self._send(DISPLAY_COMMAND, chip_select, bytes([command]))
+        self._send(DISPLAY_COMMAND, chip_select, self._command_buffer)
         self._send(DISPLAY_DATA, chip_select, data)
         self._end_transaction()
 
@@ -137,13 +166,23 @@ class FourWire:
             self._chip_select is not None
             and chip_select == CHIP_SELECT_TOGGLE_EVERY_BYTE
         ):
+            # Each byte goes out through one reused buffer. Toggling the pin takes
+            # longer than any controller's minimum chip select high time, so there
+            # is no need to sleep between bytes.
+            byte_buffer = bytearray(1)
+            write = self._spi.write
+            set_chip_select = self._set_chip_select
             for byte in data:
-                self._spi.write(bytes([byte]))
-                self._chip_select.value = True
-                time.sleep(0.000001)
-                self._chip_select.value = False
-        else:
+                byte_buffer[0] = byte
+                write(byte_buffer)
+                set_chip_select(1)
+                set_chip_select(0)
+        elif len(data) <= _SPI_WRITE_CHUNK:
             self._spi.write(data)
+        else:
+            view = memoryview(data)
+            for start in range(0, len(view), _SPI_WRITE_CHUNK):
+                self._spi.write(view[start : start + _SPI_WRITE_CHUNK])
 
     def _free(self) -> bool:
         """Attempt to free the bus and return False if busy"""
@@ -156,9 +195,15 @@ class FourWire:
         """Begin the SPI transaction by locking, configuring, and setting Chip Select"""
         if not self._spi.try_lock():
             return False
-        self._spi.configure(
-            baudrate=self._frequency, polarity=self._polarity, phase=self._phase
-        )
+        port = self._spi_port
+        if (
+            getattr(port, "baudrate", None),
+            getattr(port, "mode", None),
+            getattr(port, "bits", None),
+        ) != self._port_settings:
+            self._spi.configure(
+                baudrate=self._frequency, polarity=self._polarity, phase=self._phase
+            )
 
         if self._chip_select is not None:
             self._chip_select.value = False
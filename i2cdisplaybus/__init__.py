@@ -52,6 +52,9 @@ class I2CDisplayBus:
             self._reset = None
         self._i2c = i2c_bus
         self._dev_addr = device_address
+        # Set when commands are sent or the controller is reset outside of a display
+        # refresh, so the display knows the controller state it last sent is stale
+        self._commands_sent = False
 
     def __new__(cls, *args, **kwargs):
         from displayio import (  # pylint: disable=import-outside-toplevel, cyclic-import
@@ -73,6 +76,7 @@ class I2CDisplayBus:
         Performs a hardware reset via the reset pin if one is present.
         """
 
+        self._commands_sent = True
         if self._reset is None:
             return
 
@@ -86,6 +90,7 @@ class I2CDisplayBus:
         such as vertical scroll, set via ``send`` may or may not be reset once the code is
         done.
         """
+        self._commands_sent = True
         self._begin_transaction()
         self._send(DISPLAY_COMMAND, CHIP_SELECT_UNTOUCHED, bytes([command] + data))
         self._end_transaction()
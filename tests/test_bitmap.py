@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=protected-access
+
+import pytest
+from displayio import Bitmap
+
+
+def _bitmap_from_buffer(width, height, bits, data):
+    bitmap = Bitmap.__new__(Bitmap)
+    bitmap._from_buffer(width, height, bits, data, False)
+    return bitmap
+
+
+@pytest.mark.parametrize("bits", [4, 8, 16, 32])
+def test_supplied_buffer(bits):
+    # Rows are padded to 32-bit words. The buffer has a spare word past the bitmap.
+    words_per_row = (5 * bits + 31) // 32
+    data = bytearray((words_per_row * 3 + 1) * 4)
+    bitmap = _bitmap_from_buffer(5, 3, bits, data)
+
+    bitmap[4, 2] = 9
+    assert bitmap[4, 2] == 9
+    assert any(data)
+
+    bitmap.fill(3)
+    assert [bitmap[i] for i in range(15)] == [3] * 15
+    assert not any(data[-4:])
+
+
+def test_supplied_buffer_too_small():
+    with pytest.raises(ValueError):
+        _bitmap_from_buffer(5, 3, 16, bytearray(8))
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import time
+import displayio
+from busdisplay import BusDisplay
+from i2cdisplaybus import I2CDisplayBus
+
+# Software reset with no delay after it
+_INIT_SEQUENCE = b"\x01\x80\x00"
+
+
+class _NullI2C:
+    def __init__(self):
+        self._locked = False
+
+    def try_lock(self):
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        self._locked = False
+
+    def writeto(self, _address, buffer):
+        pass
+
+    def deinit(self):
+        pass
+
+
+def test_release_during_refresh():
+    for _ in range(10):
+        displayio.release_displays()
+        bus = I2CDisplayBus(_NullI2C(), device_address=0x3C)
+        display = BusDisplay(bus, _INIT_SEQUENCE, width=128, height=128)
+        bitmap = displayio.Bitmap(128, 128, 2)
+        palette = displayio.Palette(2)
+        palette[1] = 0xFFFFFF
+        group = displayio.Group()
+        group.append(displayio.TileGrid(bitmap, pixel_shader=palette))
+        display.root_group = group
+
+        # Keep the background thread refreshing while the display is released
+        deadline = time.monotonic() + 0.1
+        while time.monotonic() < deadline:
+            bitmap.fill(bitmap[0, 0] ^ 1)
+        # I2CDisplayBus has no deinit for release_displays() to call
+        displayio.display_buses.remove(bus)
+        displayio.release_displays()
+
+        time.sleep(0.05)
+        assert displayio.background_thread.is_alive()
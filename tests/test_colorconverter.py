@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=protected-access
+
+from displayio import ColorConverter
+from displayio._structs import ColorspaceStruct, InputPixelStruct, OutputPixelStruct
+
+
+def _convert(converter, colorspace, color):
+    output_pixel = OutputPixelStruct()
+    converter._convert(colorspace, InputPixelStruct(pixel=color), output_pixel)
+    return output_pixel.pixel
+
+
+def test_grayscale_bit_change():
+    converter = ColorConverter()
+    colorspace = ColorspaceStruct(1, grayscale=True, grayscale_bit=7)
+    assert _convert(converter, colorspace, 0x808080) == 1
+
+    # Second pass of a 4-color grayscale e-paper refresh on the same colorspace
+    colorspace.grayscale_bit = 6
+    assert _convert(converter, colorspace, 0x808080) == 0
+
+
+def test_tricolor_change():
+    converter = ColorConverter()
+    colorspace = ColorspaceStruct(
+        1,
+        grayscale=True,
+        grayscale_bit=7,
+        tricolor=True,
+        tricolor_hue=ColorConverter._compute_hue(0xFF0000),
+    )
+    assert _convert(converter, colorspace, 0xFFFFFF) == 1
+
+    # Second pass of a tricolor e-paper refresh writes the highlight color plane
+    colorspace.grayscale = False
+    assert _convert(converter, colorspace, 0xFFFFFF) == 0
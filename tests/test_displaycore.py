@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=protected-access, no-self-use
+
+import displayio
+from displayio._area import Area
+from displayio._constants import NO_COMMAND
+from displayio._displaycore import _DisplayCore
+from i2cdisplaybus import I2CDisplayBus
+
+
+class _RecordingI2C:
+    def __init__(self):
+        self.writes = []
+
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def writeto(self, _address, buffer):
+        self.writes.append(bytes(buffer))
+
+    def deinit(self):
+        pass
+
+
+def _make_core(bus):
+    return _DisplayCore(
+        bus,
+        width=32,
+        height=16,
+        ram_width=32,
+        ram_height=16,
+        colstart=0,
+        rowstart=0,
+        rotation=0,
+        color_depth=16,
+        grayscale=False,
+        pixels_in_byte_share_row=True,
+        bytes_per_cell=1,
+        reverse_pixels_in_byte=False,
+        reverse_bytes_in_word=True,
+        column_command=0x2A,
+        row_command=0x2B,
+        set_current_column_command=NO_COMMAND,
+        set_current_row_command=NO_COMMAND,
+        data_as_commands=False,
+        always_toggle_chip_select=False,
+        sh1107_addressing=False,
+        address_little_endian=False,
+    )
+
+
+def _window_commands(writes):
+    # Commands go out as a control byte of 0x80 followed by the command
+    return [write[1] for write in writes if write[0] == 0x80]
+
+
+def test_window_resent_after_send():
+    displayio.release_displays()
+    i2c = _RecordingI2C()
+    bus = I2CDisplayBus(i2c, device_address=0x3C)
+    core = _make_core(bus)
+    area = Area(0, 0, 8, 8)
+
+    core.set_region_to_update(area)
+    assert _window_commands(i2c.writes) == [0x2A, 0x2B]
+
+    i2c.writes.clear()
+    core.set_region_to_update(area)
+    assert not _window_commands(i2c.writes)
+
+    # A command from user code may move the window, so it has to be sent again
+    bus.send(0x01, [])
+    i2c.writes.clear()
+    core.set_region_to_update(area)
+    assert _window_commands(i2c.writes) == [0x2A, 0x2B]
+    # I2CDisplayBus has no deinit for release_displays() to call
+    displayio.display_buses.remove(bus)
@@ -17,7 +17,6 @@ vectorio for Blinka
 
 """
 
-import struct
 from typing import Union, Tuple
 from circuitpython_typing import WriteableBuffer
 from displayio._colorconverter import ColorConverter
@@ -163,50 +162,45 @@ class _VectorShape:
         to_transpose.x1, to_transpose.y1 = to_transpose.y1, to_transpose.x1
         to_transpose.x2, to_transpose.y2 = to_transpose.y2, to_transpose.x2
 
-    def _screen_to_shape_coordinates(self, x: int, y: int) -> Tuple[int, int]:
-        """Get the target pixel based on the shape's coordinate space"""
-        if self._absolute_transform.transpose_xy:
-            out_shape_x = (
-                y - self._absolute_transform.y - self._absolute_transform.dy * self._x
-            )
-            out_shape_y = (
-                x - self._absolute_transform.x - self._absolute_transform.dx * self._y
-            )
-
-            if self._absolute_transform.dx < 1:
-                out_shape_x *= -1
-            if self._absolute_transform.dy < 1:
-                out_shape_y *= -1
-        else:
-            out_shape_x = (
-                x - self._absolute_transform.x - self._absolute_transform.dx * self._x
-            )
-            out_shape_y = (
-                y - self._absolute_transform.y - self._absolute_transform.dy * self._y
+    def _shape_coordinate_transform(self) -> Tuple[int, int, int, int, int, int]:
+        """Get the affine map from screen coordinates to the shape's coordinate space as
+        (x_from_x, x_from_y, x_offset, y_from_x, y_from_y, y_offset), so it can be
+        applied per pixel without branching on the transform"""
+        transform = self._absolute_transform
+        sign_x = -1 if transform.dx < 1 else 1
+        sign_y = -1 if transform.dy < 1 else 1
+        if transform.transpose_xy:
+            return (
+                0,
+                sign_x,
+                -sign_x * (transform.y + transform.dy * self._x),
+                sign_y,
+                0,
+                -sign_y * (transform.x + transform.dx * self._y),
             )
+        return (
+            sign_x,
+            0,
+            -sign_x * (transform.x + transform.dx * self._x),
+            0,
+            sign_y,
+            -sign_y * (transform.y + transform.dy * self._y),
+        )
 
-            if self._absolute_transform.dx < 1:
-                out_shape_x *= -1
-            if self._absolute_transform.dy < 1:
-                out_shape_y *= -1
-
-            # It's mirrored via dx. Maybe we need to add support for also separately mirroring?
-            # if self.absolute_transform.mirror_x:
-            #    pixel_to_get_x = (
-            #        (shape_area.x2 - shape_area.x1)
-            #        - (pixel_to_get_x - shape_area.x1)
-            #        + shape_area.x1
-            #        - 1
-            #    )
-            # if self.absolute_transform.mirror_y:
-            #    pixel_to_get_y = (
-            #        (shape_area.y2 - shape_area.y1)
-            #        - (pixel_to_get_y - shape_area.y1)
-            #        + +shape_area.y1
-            #        - 1
-            #    )
-
-        return out_shape_x, out_shape_y
+    def _screen_to_shape_coordinates(self, x: int, y: int) -> Tuple[int, int]:
+        """Get the target pixel based on the shape's coordinate space"""
+        (
+            x_from_x,
+            x_from_y,
+            x_offset,
+            y_from_x,
+            y_from_y,
+            y_offset,
+        ) = self._shape_coordinate_transform()
+        return (
+            x_from_x * x + x_from_y * y + x_offset,
+            y_from_x * x + y_from_y * y + y_offset,
+        )
 
     def _shape_contains(self, x: int, y: int) -> bool:
         shape_x, shape_y = self._screen_to_shape_coordinates(x, y)
@@ -228,21 +222,40 @@ class _VectorShape:
             return False
 
         full_coverage = area == overlap
-        pixels_per_byte = 8 // colorspace.depth
+        # Colorspace settings are fixed for the whole fill, so read them once
+        depth = colorspace.depth
+        pixels_per_byte = 8 // depth
+        pixels_share_row = colorspace.pixels_in_byte_share_row
+        reverse_pixels = colorspace.reverse_pixels_in_byte
+        leftmost_shift = (pixels_per_byte - 1) * depth
         linestride_px = area.width()
         line_dirty_offset_px = (overlap.y1 - area.y1) * linestride_px
         column_dirty_offset_px = overlap.x1 - area.x1
 
         input_pixel = InputPixelStruct()
         output_pixel = OutputPixelStruct()
+        # Views of the word buffer for each pixel size, made once rather than per pixel
+        buffer_bytes = buffer.cast("B")
+        buffer_halfwords = buffer_bytes.cast("H")
 
         shape_area = Area()
         self._get_area(shape_area)
 
         mask_start_px = line_dirty_offset_px
+        (
+            x_from_x,
+            x_from_y,
+            x_offset,
+            y_from_x,
+            y_from_y,
+            y_offset,
+        ) = self._shape_coordinate_transform()
 
         for input_pixel.y in range(overlap.y1, overlap.y2):
             mask_start_px += column_dirty_offset_px
+            # The row's contribution to the shape coordinates is fixed across it
+            row_x = x_from_y * input_pixel.y + x_offset
+            row_y = y_from_y * input_pixel.y + y_offset
             for input_pixel.x in range(overlap.x1, overlap.x2):
                 # Check the mask first to see if the pixel has already been set.
                 pixel_index = mask_start_px + (input_pixel.x - overlap.x1)
@@ -253,10 +266,9 @@ class _VectorShape:
                 output_pixel.pixel = 0
 
                 # Cast input screen coordinates to shape coordinates to pick the pixel to draw
-                pixel_to_get_x, pixel_to_get_y = self._screen_to_shape_coordinates(
-                    input_pixel.x, input_pixel.y
+                input_pixel.pixel = self._get_pixel(
+                    x_from_x * input_pixel.x + row_x, y_from_x * input_pixel.x + row_y
                 )
-                input_pixel.pixel = self._get_pixel(pixel_to_get_x, pixel_to_get_y)
 
                 # vectorio shapes use 0 to mean "area is not covered."
                 # We can skip all the rest of the work for this pixel
@@ -283,26 +295,16 @@ class _VectorShape:
                         full_coverage = False
 
                     mask[pixel_index // 32] |= 1 << (pixel_index % 32)
-                    if colorspace.depth == 16:
-                        struct.pack_into(
-                            "H",
-                            buffer.cast("B"),
-                            pixel_index * 2,
-                            output_pixel.pixel,
-                        )
-                    elif colorspace.depth == 32:
-                        struct.pack_into(
-                            "I",
-                            buffer.cast("B"),
-                            pixel_index * 4,
-                            output_pixel.pixel,
-                        )
-                    elif colorspace.depth == 8:
-                        buffer.cast("B")[pixel_index] = output_pixel.pixel & 0xFF
-                    elif colorspace.depth < 8:
+                    if depth == 16:
+                        buffer_halfwords[pixel_index] = output_pixel.pixel
+                    elif depth == 32:
+                        buffer[pixel_index] = output_pixel.pixel
+                    elif depth == 8:
+                        buffer_bytes[pixel_index] = output_pixel.pixel & 0xFF
+                    elif depth < 8:
                         # Reorder the offsets to pack multiple rows into
                         # a byte (meaning they share a column).
-                        if not colorspace.pixels_in_byte_share_row:
+                        if not pixels_share_row:
                             row = pixel_index // linestride_px
                             col = pixel_index % linestride_px
                             # Dividing by pixels_per_byte does truncated division
@@ -314,11 +316,11 @@ class _VectorShape:
                                 * linestride_px
                                 + (row % pixels_per_byte)
                             )
-                        shift = (pixel_index % pixels_per_byte) * colorspace.depth
-                        if colorspace.reverse_pixels_in_byte:
+                        shift = (pixel_index % pixels_per_byte) * depth
+                        if reverse_pixels:
                             # Reverse the shift by subtracting it from the leftmost shift
-                            shift = (pixels_per_byte - 1) * colorspace.depth - shift
-                        buffer.cast("B")[pixel_index // pixels_per_byte] |= (
+                            shift = leftmost_shift - shift
+                        buffer_bytes[pixel_index // pixels_per_byte] |= (
                             output_pixel.pixel << shift
                         )
             mask_start_px += linestride_px - column_dirty_offset_px